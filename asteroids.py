@@ -1,4 +1,49 @@
-from core import Game
+import argparse
+from timeit import default_timer
+
+STARTED = default_timer()
+
+from core.main import Game  # noqa: E402
+from core.screenconstants import SCREEN_W, SCREEN_H  # noqa: E402
+
+
+def parse_args():
+    """Return parsed command line arguments."""
+    parser = argparse.ArgumentParser(description='Play Asteroids.')
+    parser.add_argument('--startup-report', action='store_true',
+                        help='print how long each phase of startup took')
+    parser.add_argument('--threaded', action='store_true',
+                        help='update the game on a separate thread to drawing')
+    parser.add_argument('--latency-report', action='store_true',
+                        help='print input to display latency of key events '
+                             'on exit')
+    parser.add_argument('--telemetry', metavar='PATH',
+                        help='publish telemetry to ring buffer file at PATH '
+                             '(watch it with monitor.py)')
+    parser.add_argument('--broadcast', metavar='TARGET',
+                        help='broadcast game to viewer.py listening on '
+                             'HOST:PORT, or record it to file TARGET')
+    return parser.parse_args()
+
 
 if __name__ == '__main__':
-    Game().play()
+    args = parse_args()
+    telemetry = None
+    if args.telemetry:
+        # Only imported when it's used, like the rest of the optional parts
+        from telemetry import TelemetryWriter
+        telemetry = TelemetryWriter(args.telemetry)
+    broadcast = None
+    if args.broadcast:
+        from core.broadcast import StreamEncoder, connect
+        broadcast = StreamEncoder(connect(args.broadcast), SCREEN_W, SCREEN_H)
+    game = Game(STARTED, args.threaded, telemetry, broadcast)
+    if args.startup_report:
+        print(game.startup.report())
+    game.play()
+    if args.latency_report:
+        print(game.latency.report())
+    if telemetry is not None:
+        telemetry.close()
+    if broadcast is not None:
+        broadcast.close()
@@ -0,0 +1,289 @@
+"""
+Broadcast of the game as a stream of vector frames, which is far smaller
+than video of the display.
+
+A stream starts with a header (magic, version, screen width and height)
+followed by one message per frame: the length of its payload, whether it
+is a key or delta frame, and then the zlib compressed payload:
+
+    time, score, highscore, lives, number of outlines, number of bullets,
+    number of particles
+    closed flag of each outline (uint8)
+    number of points in each outline (uint16)
+    coordinates of every outline point then every bullet (int16 pairs)
+    coordinates of every particle (int16 pairs)
+    brightness of every particle (uint8)
+
+Coordinates are in 1/SCALE pixel steps. In a delta frame they're the
+difference from the coordinates in the previous frame, which is only
+possible when it has the same outlines and bullets. Most things move only
+a few steps a frame, so deltas are mostly small numbers which compress
+far better than positions. Particles come and go almost every frame, so
+they're always sent as positions.
+
+Frames are encoded and written on a separate thread, so a slow viewer
+can't hold up the game. If the writer falls behind, new frames are
+dropped (before they're encoded, so deltas stay consistent) until it
+catches up.
+"""
+from __future__ import division
+
+import socket
+import struct
+import threading
+from timeit import default_timer
+import zlib
+try:
+    from queue import Full, Queue
+except ImportError:  # Python 2
+    from Queue import Full, Queue
+
+import numpy
+
+from .frames import Frame
+
+
+MAGIC = b'ASTV'
+VERSION = 2
+
+STREAM_HEADER = struct.Struct('<4sBHH')
+MESSAGE_HEADER = struct.Struct('<IB')
+FRAME_HEADER = struct.Struct('<fIIBHHI')
+
+SCALE = 4
+KEYFRAME_INTERVAL = 120  # Maximum number of delta frames in a row
+QUEUE_SIZE = 8  # Frames waiting to be written before new ones are dropped
+CLOSE_TIMEOUT = 2  # Seconds to wait for queued frames to be written on close
+
+# Message kinds
+KEY = 0
+DELTA = 1
+
+
+def parse_address(target):
+    """Return (host, port) if target is of form HOST:PORT, else None."""
+    host, _, port = target.rpartition(':')
+    if host and port.isdigit() and not any(c in host for c in '/\\'):
+        return host, int(port)
+    return None
+
+
+def connect(target):
+    """
+    Return stream for writing broadcast to target, which is either the
+    HOST:PORT a viewer is listening on or the path of a file to record to.
+    """
+    address = parse_address(target)
+    if address is None:
+        return open(target, 'wb')
+    connection = socket.create_connection(address)
+    # Frames are small and should be sent as soon as they're written
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return connection.makefile('wb')
+
+
+def listen(target):
+    """Wait for game to connect to HOST:PORT and return stream from it."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(parse_address(target))
+    server.listen(1)
+    connection, _ = server.accept()
+    server.close()
+    return connection.makefile('rb')
+
+
+def read_exactly(stream, size):
+    """
+    Return next size bytes from stream, or None if stream ends before
+    then.
+    """
+    data = b''
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+class StreamEncoder:
+    """Writes frames to stream as a broadcast, on its own thread."""
+
+    def __init__(self, stream, width, height):
+        self.stream = stream
+        self.stream.write(STREAM_HEADER.pack(MAGIC, VERSION, width, height))
+        self.start = default_timer()
+        self.last_frame = None
+        # Number of frames dropped because the writer was behind
+        self.dropped = 0
+        # Outlines/bullets and coordinates of last frame written
+        self.structure = None
+        self.coordinates = None
+        self.deltas = 0
+        self.queue = Queue(QUEUE_SIZE)
+        self.writer = threading.Thread(target=self.write_frames)
+        self.writer.daemon = True
+        self.writer.start()
+
+    def send(self, frame):
+        """
+        Queue frame to be written, unless it's the frame that was just
+        sent. Never waits: if the queue is full, frame is dropped.
+
+        Frames are timed here rather than when they're written, so that
+        frames which wait in the queue keep the pace they were sent at.
+        """
+        if self.stream is None or frame is self.last_frame:
+            return
+        self.last_frame = frame
+        try:
+            self.queue.put_nowait((default_timer() - self.start, frame))
+        except Full:
+            self.dropped += 1
+
+    def write_frames(self):
+        """
+        Encode and write queued frames until None is queued.
+
+        If stream can't be written to (i.e. viewer has gone away) then
+        broadcasting stops rather than interrupting the game.
+        """
+        while True:
+            item = self.queue.get()
+            if item is None or self.stream is None:
+                return
+            try:
+                self.stream.write(self.encode(*item))
+                self.stream.flush()
+            except (IOError, OSError, ValueError):
+                self.stream = None
+                return
+
+    def encode(self, time, frame):
+        """Return message for frame, sent time seconds into broadcast."""
+        closed = numpy.array([c for c, _ in frame.outlines], dtype=numpy.uint8)
+        counts = numpy.array([len(points) for _, points in frame.outlines],
+                             dtype=numpy.uint16)
+        points = [numpy.asarray(points, dtype=float).reshape(-1, 2)
+                  for _, points in frame.outlines]
+        points.append(numpy.asarray(frame.bullets, dtype=float).reshape(-1, 2))
+        coordinates = numpy.round(numpy.concatenate(points) * SCALE).astype(
+            numpy.int16)
+
+        structure = (closed.tobytes(), counts.tobytes(), len(frame.bullets))
+        if structure == self.structure and self.deltas < KEYFRAME_INTERVAL:
+            kind = DELTA
+            # int16 arithmetic wraps, and wraps back when decoded
+            data = coordinates - self.coordinates
+            self.deltas += 1
+        else:
+            kind = KEY
+            data = coordinates
+            self.deltas = 0
+        self.structure = structure
+        self.coordinates = coordinates
+
+        particles = numpy.round(frame.particles[:, :2] * SCALE).astype(
+            numpy.int16)
+        brightness = numpy.round(frame.particles[:, 2] * 255).astype(
+            numpy.uint8)
+
+        header = FRAME_HEADER.pack(
+            time, frame.score, frame.highscore, frame.lives,
+            len(frame.outlines), len(frame.bullets), len(frame.particles))
+        payload = zlib.compress(b''.join([
+            header, structure[0], structure[1], data.tobytes(),
+            particles.tobytes(), brightness.tobytes()]))
+        return MESSAGE_HEADER.pack(len(payload), kind) + payload
+
+    def close(self):
+        """
+        Close stream once queued frames have been written.
+
+        A writer which is still stuck after CLOSE_TIMEOUT seconds is left
+        to die with the process, since closing stream under it would wait
+        for its write to finish too.
+        """
+        try:
+            self.queue.put(None, timeout=CLOSE_TIMEOUT)
+        except Full:
+            pass
+        self.writer.join(CLOSE_TIMEOUT)
+        stream, self.stream = self.stream, None
+        if stream is not None and not self.writer.is_alive():
+            try:
+                stream.close()
+            except (IOError, OSError):
+                pass
+
+
+class StreamDecoder:
+    """Reads frames from a broadcast stream."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        header = read_exactly(stream, STREAM_HEADER.size)
+        if header is None:
+            raise ValueError('broadcast ended before it started')
+        magic, version, self.width, self.height = STREAM_HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError('not a broadcast stream')
+        if version != VERSION:
+            raise ValueError('broadcast has version {}, expected {}'.format(
+                version, VERSION))
+        self.coordinates = None
+        self.decoded = 0
+
+    def frames(self):
+        """
+        Yield (time, frame) for each frame in stream, where time is
+        seconds since the broadcast started.
+        """
+        while True:
+            header = read_exactly(self.stream, MESSAGE_HEADER.size)
+            if header is None:
+                return
+            length, kind = MESSAGE_HEADER.unpack(header)
+            payload = read_exactly(self.stream, length)
+            if payload is None:
+                return
+            yield self.decode(kind, zlib.decompress(payload))
+
+    def decode(self, kind, payload):
+        """Return (time, frame) from decompressed payload."""
+        (time, score, highscore, lives, outline_count, bullet_count,
+         particle_count) = FRAME_HEADER.unpack_from(payload)
+        offset = FRAME_HEADER.size
+        closed = numpy.frombuffer(payload, numpy.uint8, outline_count, offset)
+        offset += closed.nbytes
+        counts = numpy.frombuffer(payload, numpy.uint16, outline_count,
+                                  offset)
+        offset += counts.nbytes
+        point_count = int(counts.sum()) + bullet_count
+        data = numpy.frombuffer(payload, numpy.int16, 2 * point_count, offset)
+        offset += data.nbytes
+        data = data.reshape(-1, 2)
+        particles = numpy.frombuffer(payload, numpy.int16, 2 * particle_count,
+                                     offset)
+        offset += particles.nbytes
+        brightness = numpy.frombuffer(payload, numpy.uint8, particle_count,
+                                      offset)
+        particles = numpy.column_stack([particles.reshape(-1, 2) / SCALE,
+                                        brightness / 255])
+        particles.flags.writeable = False
+        if kind == DELTA:
+            data = self.coordinates + data
+        self.coordinates = data
+
+        points = data / SCALE
+        points.flags.writeable = False
+        outlines = []
+        start = 0
+        for is_closed, count in zip(closed, counts):
+            outlines.append((bool(is_closed), points[start:start + count]))
+            start += count
+        self.decoded += 1
+        frame = Frame(tuple(outlines), points[start:], particles, score,
+                      highscore, lives, self.decoded)
+        return time, frame
@@ -1,3 +1,4 @@
 from .asteroid import Asteroid
 from .hud import HUD
+from .particles import Particles
 from .ships import Saucer, Ship
@@ -23,6 +23,8 @@ class Asteroid(BasePolygon):
     a ship/saucer.
     """
 
+    __slots__ = ('radius', 'size', 'velocity')
+
     def __init__(self, centre=None, radius=INITIAL_RADIUS, size=3):
         self.radius = radius
         self.size = size
@@ -69,9 +71,14 @@ class Asteroid(BasePolygon):
 
     def update(self, dt):
         """Update asteroid by dt seconds."""
-        self.move_ip(*self.velocity * dt)
+        self.move_ip(self.velocity.x * dt, self.velocity.y * dt)
         self.wrap()
 
+    def outlines(self):
+        """Return (closed, points) pairs for lines making up asteroid."""
+        return [(True, self.P)]
+
     def draw(self, surface):
         """Draw asteroid to surface."""
-        pygame.draw.aalines(surface, WHITE, True, self.P)
+        for closed, points in self.outlines():
+            pygame.draw.aalines(surface, WHITE, closed, points)
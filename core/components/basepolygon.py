@@ -6,12 +6,23 @@ from pylygon import Polygon
 from ..screenconstants import SCREEN_W, SCREEN_H, SCREEN_RECT
 
 
+def freeze(points):
+    """Return read only copy of points as numpy array."""
+    points = array(points, dtype=float)
+    points.flags.writeable = False
+    return points
+
+
 class BasePolygon(Polygon):
     """
     Base polygon class which includes some modifications to the original
     Polygon class methods.
     """
 
+    # Polygon instances still have a __dict__, but attributes of subclasses
+    # which are listed in their __slots__ are kept out of it
+    __slots__ = ()
+
     # Original Polygon _rotate method uses 'if not origin:' to test if origin
     # is None which does not work for a numpy array as the truth value of a
     # numpy array with more than one element is ambiguous.
@@ -38,6 +49,12 @@ class BasePolygon(Polygon):
         self.P[:] = self.rotopoints(theta)
         self.edges[:] = self.rotoedges(theta)
 
+    # Original Polygon move_ip method builds a new array from a list of moved
+    # point tuples, which is done for every polygon every frame.
+    def move_ip(self, x, y):
+        # self.P = array([(x + p_x, y + p_y) for (p_x, p_y) in self.P])
+        self.P += (x, y)
+
     def hits(self, other):
         """Return true if self hits other polygon."""
         return self.collidepoly(other) is not False
@@ -1,38 +1,47 @@
-import pygame.freetype
-
-from ..helpers import find_asset
+from ..helpers import FONT_PATH, load_font
 from ..screenconstants import SCREEN_H
 from .ships import Ship
 
 
 WHITE = (255, 255, 255)
 
-FONT_PATH = find_asset('fonts\Hyperspace.otf')
-
-PADDING = 0.02 * SCREEN_H
-SCORE_SIZE = 0.06 * SCREEN_H
-ICON_LENGTH = 0.045 * SCREEN_H
+# Sizes as fractions of screen height
+PADDING = 0.02
+SCORE_SIZE = 0.06
+ICON_LENGTH = 0.045
 
 
 class HUD:
     """HUD object which displays score and number of lives ship has."""
-    def __init__(self):
-        pygame.freetype.init()
-        self.font = pygame.freetype.Font(FONT_PATH, SCORE_SIZE)
-        # life icon is just a ship object which only gets drawn
-        self.icon = Ship(ICON_LENGTH, self.icon_centre())
+    def __init__(self, screen_h=SCREEN_H):
+        # screen_h is the height of the screen HUD is drawn on, which is only
+        # different to this one's when watching a broadcast
+        self.screen_h = screen_h
+        self.padding = PADDING * screen_h
+        self.score_size = SCORE_SIZE * screen_h
+        self.icon_length = ICON_LENGTH * screen_h
+        # Shares the font loaded by the game, size is given when rendering
+        self.font = load_font(FONT_PATH)
+        # life icon is just a ship object which only gets drawn, it's built
+        # the first time it's needed
+        self.icon = None
 
     def icon_centre(self):
         """Return centre for life icon."""
         # This aligns icon horizontally with score
-        x = 0.36 * ICON_LENGTH
+        x = 0.36 * self.icon_length
         # This moves icon below score
-        score_height = self.font.get_rect('0', size=SCORE_SIZE).height
-        y = 0.67 * ICON_LENGTH + score_height + 0.015 * SCREEN_H
+        score_height = self.font.get_rect('0', size=self.score_size).height
+        y = 0.67 * self.icon_length + score_height + 0.015 * self.screen_h
         return (x, y)
 
     def draw(self, surface, score, lives):
         """Draw HUD to surface."""
-        self.font.render_to(surface, (PADDING, PADDING), str(score), WHITE)
+        if self.icon is None:
+            self.icon = Ship(self.icon_length, self.icon_centre())
+        padding = self.padding
+        self.font.render_to(surface, (padding, padding), str(score), WHITE,
+                            size=self.score_size)
         for i in range(lives):
-            self.icon.move(PADDING + i * ICON_LENGTH, PADDING).draw(surface)
+            self.icon.move(padding + i * self.icon_length, padding).draw(
+                surface)
@@ -0,0 +1,69 @@
+from __future__ import division
+
+import numpy
+
+from ..points import draw_points
+from ..screenconstants import SCREEN_W, SCREEN_H
+
+
+PARTICLE_MIN_SPEED = 0.05 * SCREEN_H
+PARTICLE_MAX_SPEED = 0.25 * SCREEN_H
+PARTICLE_MIN_LIFESPAN = 0.4  # Seconds
+PARTICLE_MAX_LIFESPAN = 1.0
+
+
+class Particles:
+    """
+    Debris thrown out when things are destroyed, which fades away.
+
+    Particles are stored in arrays rather than as objects so that they can
+    all be updated (and drawn) at once.
+    """
+
+    def __init__(self):
+        self.positions = numpy.empty((0, 2))
+        self.velocities = numpy.empty((0, 2))
+        self.ages = numpy.empty(0)
+        self.lifespans = numpy.empty(0)
+
+    def __len__(self):
+        return len(self.ages)
+
+    def emit(self, centre, count, velocity=(0, 0)):
+        """
+        Throw out count particles in random directions from centre, on top
+        of velocity of whatever they came from.
+        """
+        theta = numpy.random.uniform(0, 2 * numpy.pi, count)
+        speed = numpy.random.uniform(PARTICLE_MIN_SPEED, PARTICLE_MAX_SPEED,
+                                     count)
+        velocities = speed[:, None] * numpy.column_stack(
+            [numpy.cos(theta), numpy.sin(theta)]) + tuple(velocity)
+        positions = numpy.tile(numpy.asarray(centre, dtype=float), (count, 1))
+        lifespans = numpy.random.uniform(PARTICLE_MIN_LIFESPAN,
+                                         PARTICLE_MAX_LIFESPAN, count)
+        self.positions = numpy.concatenate([self.positions, positions])
+        self.velocities = numpy.concatenate([self.velocities, velocities])
+        self.ages = numpy.concatenate([self.ages, numpy.zeros(count)])
+        self.lifespans = numpy.concatenate([self.lifespans, lifespans])
+
+    def update(self, dt):
+        """Update particles by dt seconds, removing those which have faded."""
+        self.ages += dt
+        alive = self.ages < self.lifespans
+        if not alive.all():
+            self.positions = self.positions[alive]
+            self.velocities = self.velocities[alive]
+            self.ages = self.ages[alive]
+            self.lifespans = self.lifespans[alive]
+        self.positions += self.velocities * dt
+        # Wrap to opposite side of screen
+        self.positions %= (SCREEN_W, SCREEN_H)
+
+    def brightness(self):
+        """Return brightness of each particle, fading from 1 to 0."""
+        return 1 - self.ages / self.lifespans
+
+    def draw(self, surface):
+        """Draw particles to surface."""
+        draw_points(surface, self.positions, brightness=self.brightness())
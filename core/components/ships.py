@@ -18,6 +18,8 @@ INITIAL_CENTRE = (SCREEN_W / 2, SCREEN_H / 2)
 SHIP_ROTATE_SPEED = 0.8  # Full rotations per second
 SHIP_INVINCIBLE_TIME = 2  # Number of seconds ship will be invincible for
 SHIP_INVINCIBLE_FLICKER_RATE = 12  # Flickers per second when invincible
+SHIP_DRAG = 0.99  # Fraction of velocity kept every SHIP_DRAG_TIME seconds
+SHIP_DRAG_TIME = 1 / 60  # One update at the game's usual frame rate
 
 # SAUCER CONSTANTS
 SAUCER_SMALL_SPEED = 0.15 * SCREEN_W
@@ -30,13 +32,26 @@ SAUCER_FIRE_RATE = 0.5  # Shots per second
 
 # BULLET CONSTANTS
 BULLET_SPEED = 0.8 * SCREEN_H
-BULLET_RADIUS = SCREEN_H // 300
 BULLET_LIFESPAN = 0.9  # Duration in seconds until bullet fades
 
 
+def bullet_radius(screen_h):
+    """Return radius of bullets on a screen screen_h pixels high."""
+    return screen_h // 300
+
+
+BULLET_RADIUS = bullet_radius(SCREEN_H)
+
+
 class Ship(BasePolygon):
     """Main ship object which is controlled by player."""
 
+    __slots__ = (
+        'length', 'rear_length', 'flame_length', 'flame_width',
+        'initial_centre', 'rotate_direction', 'boosting', 'direction',
+        'velocity', 'invincible', 'invincible_duration', 'fired_bullets',
+        )
+
     def __init__(self, length=SHIP_LENGTH, initial_centre=INITIAL_CENTRE):
         self.length = length
         self.rear_length = 0.75 * length
@@ -89,63 +104,121 @@ class Ship(BasePolygon):
         Return True if one of ships bullets hits other and removes that
         bullet from fired_bullets.
         """
-        for bullet in reversed(self.fired_bullets):
-            if bullet.hits(other):
-                self.fired_bullets.remove(bullet)
+        bullets = self.fired_bullets
+        # Bullets are vectors, which list.remove would match by value rather
+        # than identity, so they're deleted by index
+        for i in reversed(range(len(bullets))):
+            if bullets[i].hits(other):
+                del bullets[i]
                 return True
         return False
 
-    def update(self, dt):
-        """Update ship and fired bullets by dt seconds."""
+    def steer(self, dt, drag=1):
+        """
+        Rotate, boost and move ship for dt seconds, keeping drag of its
+        velocity after boosting.
+        """
+        self.rotate(SHIP_ROTATE_SPEED * 360 * dt * self.rotate_direction)
+        # Velocity is updated a component at a time, rather than with vector
+        # arithmetic, so that no temporary vectors are made
+        velocity = self.velocity
+        if self.boosting:
+            boost = SHIP_BOOST_FORCE * dt
+            velocity.x += boost * self.direction.x
+            velocity.y += boost * self.direction.y
+        velocity *= drag
+        self.move_ip(velocity.x * dt, velocity.y * dt)
+        self.wrap()
+
+    def update(self, dt, actions=()):
+        """
+        Update ship and fired bullets by dt seconds.
+
+        actions are (offset, action) pairs in order of offset. Each action
+        (i.e. processing a key press) is called once the ship has been
+        steered for offset seconds, so that it takes effect from the moment
+        it happened rather than at the start of the update.
+        """
         if self.invincible:
             self.invincible_duration += dt
             if self.invincible_duration > SHIP_INVINCIBLE_TIME:
                 self.invincible_duration = 0
                 self.invincible = False
 
-        self.rotate(SHIP_ROTATE_SPEED * 360 * dt * self.rotate_direction)
-        if self.boosting:
-            self.velocity += SHIP_BOOST_FORCE * self.direction * dt
-        self.velocity = self.velocity.lerp((0, 0), 0.01)
-        self.move_ip(*(self.velocity * dt))
-        self.wrap()
-
-        for bullet in reversed(self.fired_bullets):
-            if bullet.faded:
-                self.fired_bullets.remove(bullet)
+        bullets = self.fired_bullets
+        for i in reversed(range(len(bullets))):
+            if bullets[i].faded:
+                del bullets[i]
             else:
-                bullet.update(dt)
+                bullets[i].update(dt)
+
+        elapsed = 0
+        for offset, action in actions:
+            self.steer(offset - elapsed)
+            elapsed = offset
+            fired = len(self.fired_bullets)
+            action()
+            # Bullets fired by action have been flying since offset
+            for bullet in self.fired_bullets[fired:]:
+                bullet.update(dt - offset)
+        # Drag is applied once per update, however it's split up, after the
+        # last boost just as when there's no split. It's scaled by dt so that
+        # the ship slows down just as fast however often it's updated.
+        self.steer(dt - elapsed, SHIP_DRAG ** (dt / SHIP_DRAG_TIME))
 
     def flame_points(self):
         """Return points for ships boost flame."""
-        origin = self.P[2] - (self.rear_length * self.direction)
+        dx, dy = self.direction
+        nose_x, nose_y = self.P[2]
+        x = nose_x - self.rear_length * dx
+        y = nose_y - self.rear_length * dy
+        # Half width of flame along direction rotated by 90 degrees
+        w_x = -self.flame_width * dy
+        w_y = self.flame_width * dx
         return [
-            origin - self.flame_width * self.direction.rotate(90),
-            origin - self.flame_length * self.direction,
-            origin + self.flame_width * self.direction.rotate(90),
+            (x - w_x, y - w_y),
+            (x - self.flame_length * dx, y - self.flame_length * dy),
+            (x + w_x, y + w_y),
         ]
 
-    def draw(self, surface):
-        """Draw ship (and its boost flame) to surface."""
+    def outlines(self):
+        """
+        Return (closed, points) pairs for lines making up ship (and its
+        boost flame), which is none of them while ship is flickered out.
+        """
         # If invincible, ship should flicker INVINCIBLE_FLICKER_RATE (n) times
         # per second. So split each second into intervals of width 1/n (w).
         # Want ship to not be drawn every other w seconds, so floor divide
         # invincible_duration by W and if result is odd then don't draw
         w = 1 / SHIP_INVINCIBLE_FLICKER_RATE
-        if not self.invincible or (self.invincible_duration // w) % 2 == 0:
+        if self.invincible and (self.invincible_duration // w) % 2 != 0:
+            return []
+        outlines = [
             # Line joining points on opposite sides of ship
-            pygame.draw.aalines(surface, WHITE, False, [self.P[1], self.P[3]])
-            pygame.draw.aalines(surface, WHITE, False, self.P)
-            if self.boosting:
-                pygame.draw.aalines(surface, WHITE, False, self.flame_points())
+            (False, [self.P[1], self.P[3]]),
+            (False, self.P),
+            ]
+        if self.boosting:
+            outlines.append((False, self.flame_points()))
+        return outlines
 
-        for bullet in self.fired_bullets:
-            bullet.draw(surface)
+    def draw(self, surface):
+        """
+        Draw ship (and its boost flame) to surface. Its bullets are drawn
+        along with every other bullet by the game.
+        """
+        for closed, points in self.outlines():
+            pygame.draw.aalines(surface, WHITE, closed, points)
 
 
 class Saucer(BasePolygon):
     """Saucer object which shoots bullets at main ship."""
 
+    __slots__ = (
+        'size', 'height', 'width', 'speed', 'direction', 'shot_timer',
+        'fired_bullets',
+        )
+
     def __init__(self, size):
         self.size = size  # 1 = small, 2 = large
         self.height = SAUCER_SMALL_HEIGHT if size == 1 else SAUCER_LARGE_HEIGHT
@@ -228,9 +301,12 @@ class Saucer(BasePolygon):
         Return True if one of saucers bullets hits other and removes
         that bullet from fired_bullets.
         """
-        for bullet in reversed(self.fired_bullets):
-            if bullet.hits(other):
-                self.fired_bullets.remove(bullet)
+        bullets = self.fired_bullets
+        # Bullets are vectors, which list.remove would match by value rather
+        # than identity, so they're deleted by index
+        for i in reversed(range(len(bullets))):
+            if bullets[i].hits(other):
+                del bullets[i]
                 return True
         return False
 
@@ -257,35 +333,42 @@ class Saucer(BasePolygon):
             self.shot_timer %= 1 / SAUCER_FIRE_RATE
             self.shoot(ship)
 
-        for bullet in reversed(self.fired_bullets):
-            if bullet.faded:
-                self.fired_bullets.remove(bullet)
+        bullets = self.fired_bullets
+        for i in reversed(range(len(bullets))):
+            if bullets[i].faded:
+                del bullets[i]
             else:
-                bullet.update(dt)
+                bullets[i].update(dt)
 
-    def draw(self, surface):
-        """Draw saucer to surface."""
-        pygame.draw.aalines(surface, WHITE, True, self.P)
-        # Lines joining points on opposite sides of saucer
-        pygame.draw.aalines(surface, WHITE, False, [self.P[0], self.P[4]])
-        pygame.draw.aalines(surface, WHITE, False, [self.P[5], self.P[9]])
+    def outlines(self):
+        """Return (closed, points) pairs for lines making up saucer."""
+        return [
+            (True, self.P),
+            # Lines joining points on opposite sides of saucer
+            (False, [self.P[0], self.P[4]]),
+            (False, [self.P[5], self.P[9]]),
+            ]
 
-        for bullet in self.fired_bullets:
-            bullet.draw(surface)
+    def draw(self, surface):
+        """Draw saucer (but not its bullets) to surface."""
+        for closed, points in self.outlines():
+            pygame.draw.aalines(surface, WHITE, closed, points)
 
 
 class Bullet(Vector2):
-    """Bullet object."""
+    """Bullet object, which is its own position."""
+
+    __slots__ = ('velocity', 'duration', 'faded')
 
     def __init__(self, source, direction):
-        self.centre = Vector2(*source)
+        super(Bullet, self).__init__(source[0], source[1])
         self.velocity = BULLET_SPEED * direction
         self.duration = 0
         self.faded = False
 
     def hits(self, other):
         """Return True if bullet hits other polygon."""
-        return other.collidepoint(self.centre) != 0
+        return other.collidepoint(self) != 0
 
     def wrap(self):
         """
@@ -293,26 +376,21 @@ class Bullet(Vector2):
         """
         # Test whether centre is off screen first, since it's costly
         # to call hits method
-        if not (0 <= self.centre <= SCREEN_W and 0 <= self.centre <= SCREEN_H):
+        if not (0 <= self.x <= SCREEN_W and 0 <= self.y <= SCREEN_H):
             if not self.hits(SCREEN_RECT):
-                if ((self.centre.x < 0 and self.velocity.x < 0)
-                   or (self.centre.x > SCREEN_W and self.velocity.x > 0)):
-                    self.centre.x = SCREEN_W - self.centre.x
-                elif ((self.centre.y < 0 and self.velocity.y < 0)
-                      or (self.centre.y > SCREEN_H and self.velocity.y > 0)):
-                    self.centre.y = SCREEN_H - self.centre.y
+                if ((self.x < 0 and self.velocity.x < 0)
+                   or (self.x > SCREEN_W and self.velocity.x > 0)):
+                    self.x = SCREEN_W - self.x
+                elif ((self.y < 0 and self.velocity.y < 0)
+                      or (self.y > SCREEN_H and self.velocity.y > 0)):
+                    self.y = SCREEN_H - self.y
 
     def update(self, dt):
         """Update bullet by dt seconds."""
         if self.duration < BULLET_LIFESPAN:
             self.duration += dt
-            self.centre += self.velocity * dt
+            self.x += self.velocity.x * dt
+            self.y += self.velocity.y * dt
             self.wrap()
         else:
             self.faded = True
-
-    def draw(self, surface):
-        """Draw bullet to surface."""
-        # draw.circle takes only integer arguments for centre position
-        int_centre = map(int, map(round, self.centre))
-        pygame.draw.circle(surface, WHITE, int_centre, BULLET_RADIUS)
@@ -0,0 +1,93 @@
+from collections import namedtuple
+
+import pygame
+
+from .components.ships import bullet_radius
+from .helpers import FONT_PATH, load_font
+from .points import draw_points
+
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+# Sizes for text on game over screen, as fractions of screen height
+GAMEOVER_SIZE = 0.2
+SCORE_SIZE = 0.12
+PLAY_AGAIN_SIZE = 0.08
+
+# Everything needed to draw one frame of the game. outlines is a tuple of
+# (closed, points) pairs, bullets is an array of bullet centres and particles
+# is an array of (x, y, brightness) rows, all of which are read only copies
+# so that a frame never changes once it's made. step is the number of
+# updates there had been when frame was made.
+Frame = namedtuple('Frame', ['outlines', 'bullets', 'particles', 'score',
+                             'highscore', 'lives', 'step'])
+
+
+class FrameBuffer:
+    """
+    Double buffer which hands frames from the thread updating the game to
+    the thread drawing it.
+
+    The writer puts each new frame in the back slot and then publishes it
+    by flipping which slot is at the front. Frames are immutable and both
+    steps are single assignments, so neither side ever has to take a lock.
+    """
+
+    def __init__(self, frame):
+        self.slots = [frame, frame]
+        self.front = 0
+
+    def publish(self, frame):
+        """Make frame the latest frame."""
+        back = 1 - self.front
+        self.slots[back] = frame
+        self.front = back
+
+    def latest(self):
+        """Return the most recently published frame."""
+        return self.slots[self.front]
+
+
+def draw_frame(surface, frame, hud):
+    """
+    Draw frame (and the HUD) to surface, or the game over screen if frame
+    is from after game over.
+    """
+    if frame.lives <= 0:
+        draw_game_over_screen(surface, frame.score, frame.highscore)
+        return
+    surface.fill(BLACK)
+    # Particles are drawn first, as they are when drawing the game itself
+    particles = frame.particles
+    draw_points(surface, particles[:, :2], brightness=particles[:, 2])
+    for closed, points in frame.outlines:
+        pygame.draw.aalines(surface, WHITE, closed, points)
+    draw_points(surface, frame.bullets, bullet_radius(surface.get_height()))
+    hud.draw(surface, frame.score, frame.lives)
+
+
+def draw_game_over_screen(surface, score, highscore):
+    """Draw game over screen, sized to fit surface."""
+    font = load_font(FONT_PATH)
+    width, height = surface.get_size()
+    sizes = [GAMEOVER_SIZE * height, SCORE_SIZE * height,
+             PLAY_AGAIN_SIZE * height]
+    surface.fill(BLACK)
+    # Calculations for spacing of text
+    v = 0.1 * height
+    h1, h2, h3 = [font.get_rect('0', size=size).height for size in sizes]
+    s2 = 0.5 * h2
+    s1 = 0.5 * (height - 2 * v - h1 - 2 * h2 - h3 - s2)
+    lines = [
+        ('game over', sizes[0], h1 + s1),
+        ('score {}'.format(score), sizes[1], h2 + s2),
+        ('highscore {}'.format(highscore), sizes[1], h2 + s1),
+        ('press space to play again', sizes[2], 0),
+    ]
+    y = v
+    for text, size, gap in lines:
+        # Centre text horizontally
+        x = 0.5 * (width - font.get_rect(text, size=size).width)
+        font.render_to(surface, (x, y), text, WHITE, size=size)
+        y += gap
@@ -1,5 +1,10 @@
 import os
 import sys
+from timeit import default_timer
+
+
+# Fonts which have already been loaded, keyed by (path, size)
+_fonts = {}
 
 
 def find_asset(asset):
@@ -17,3 +22,55 @@ def find_asset(asset):
         current_dir = os.path.abspath(os.path.dirname(__file__))
         asset_dir = os.path.join(current_dir, '..\\assets\\')
     return os.path.join(asset_dir, asset)
+
+
+FONT_PATH = find_asset('fonts\Hyperspace.otf')
+
+
+def load_font(path, size=0):
+    """
+    Return font at path with default size, only loading it the first time
+    it's asked for.
+
+    The freetype module isn't imported or initialised until a font is
+    actually needed.
+    """
+    key = (path, size)
+    if key not in _fonts:
+        import pygame.freetype
+        if not pygame.freetype.was_init():
+            pygame.freetype.init()
+        _fonts[key] = pygame.freetype.Font(path, size)
+    return _fonts[key]
+
+
+class PhaseTimer:
+    """Records how long each phase of some process (i.e. startup) takes."""
+
+    def __init__(self, start=None):
+        self.phases = []
+        self.last = default_timer() if start is None else start
+
+    def mark(self, phase):
+        """Record time since the last phase ended as the length of phase."""
+        now = default_timer()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def split(self, phase, seconds):
+        """
+        Record seconds of the last phase, which were timed separately, as
+        phase instead.
+        """
+        last, total = self.phases[-1]
+        self.phases[-1] = (last, total - seconds)
+        self.phases.append((phase, seconds))
+
+    def report(self):
+        """Return table of how long each phase took in milliseconds."""
+        rows = list(self.phases)
+        rows.append(('total', sum(seconds for _, seconds in self.phases)))
+        return '\n'.join(
+            '{:<10}{:>8.1f} ms'.format(phase, 1000 * seconds)
+            for phase, seconds in rows
+            )
@@ -0,0 +1,63 @@
+from collections import deque, namedtuple
+from math import ceil
+from timeit import default_timer
+
+import pygame
+
+
+# Number of most recent latency measurements which are kept
+SAMPLES = 1000
+
+# Key event along with the time (from timeit.default_timer) it was received
+TimedEvent = namedtuple('TimedEvent', ['time', 'event'])
+
+
+class LatencyMeter:
+    """
+    Measures the time from key events being received to the first frame
+    they've affected being displayed.
+    """
+
+    def __init__(self):
+        # (step, timed event) of events which have been applied to the game
+        # by update step but not displayed yet
+        self.pending = deque()
+        # (key, latency) of most recently displayed events
+        self.samples = deque(maxlen=SAMPLES)
+        # Latencies which haven't been collected (i.e. for telemetry) yet
+        self.measured = deque(maxlen=SAMPLES)
+
+    def applied(self, step, timed_event):
+        """Record that timed_event was applied by update step."""
+        self.pending.append((step, timed_event))
+
+    def displayed(self, step):
+        """
+        Record that the frame made after update step has been displayed,
+        measuring the latency of every event applied up to then.
+        """
+        now = default_timer()
+        while self.pending and self.pending[0][0] <= step:
+            _, timed_event = self.pending.popleft()
+            latency = now - timed_event.time
+            self.samples.append((timed_event.event.key, latency))
+            self.measured.append(latency)
+
+    def report(self):
+        """Return summary of latencies overall and for each key."""
+        if not self.samples:
+            return 'no input latency measured'
+        by_key = {}
+        for key, latency in self.samples:
+            by_key.setdefault(key, []).append(latency)
+        rows = [('all', [latency for _, latency in self.samples])]
+        rows.extend((pygame.key.name(key), latencies)
+                    for key, latencies in sorted(by_key.items()))
+        lines = ['input latency   events   mean ms    p95 ms    max ms']
+        for name, latencies in rows:
+            latencies = sorted(latencies)
+            p95 = latencies[int(ceil(0.95 * len(latencies))) - 1]
+            lines.append('{:<14}{:>8}{:>10.1f}{:>10.1f}{:>10.1f}'.format(
+                name, len(latencies), 1000 * sum(latencies) / len(latencies),
+                1000 * p95, 1000 * latencies[-1]))
+        return '\n'.join(lines)
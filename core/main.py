@@ -1,16 +1,26 @@
 from __future__ import division
+from collections import deque
+from functools import partial
 from random import uniform
+import threading
+from timeit import default_timer
 
+import numpy
 import pygame as pg
-import pygame.freetype
+from telemetry import (ASTEROID_DESTROYED, FRAME, INPUT_LATENCY, LIFE_LOST,
+                       ROUND_START, SAUCER_SPAWNED)
 
-from .components import Asteroid, HUD, Saucer, Ship
-from .helpers import find_asset
-from .screenconstants import SCREEN_W, SCREEN_H
+from .components import Asteroid, HUD, Particles, Saucer, Ship
+from .components.basepolygon import freeze
+from .components.ships import BULLET_RADIUS
+from .frames import Frame, FrameBuffer, draw_frame, draw_game_over_screen
+from .helpers import PhaseTimer
+from .inputs import LatencyMeter, TimedEvent
+from .points import draw_points
+from .screenconstants import DISPLAY_INIT_TIME, SCREEN_W, SCREEN_H
 
 
 BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
 
 INITIAL_ASTEROIDS = 4
 SECONDS_PER_SAUCER = 30
@@ -28,38 +38,63 @@ SAUCER_SCORE = {
 }
 EXTRA_LIFE_SCORE = 10000
 
-# Sizes for text on game over screen
-GAMEOVER_SIZE = 0.2 * SCREEN_H
-SCORE_SIZE = 0.12 * SCREEN_H
-PLAY_AGAIN_SIZE = 0.08 * SCREEN_H
-FONT_PATH = find_asset('fonts\Hyperspace.otf')
+# Number of particles thrown out when things are destroyed
+ASTEROID_PARTICLES = 15  # Per size of asteroid
+SAUCER_PARTICLES = 40
 
 MAX_FPS = 60
+SIMULATION_FPS = 120  # Update rate when simulating on a separate thread
 
 
 class Game:
     """Asteroids game."""
 
-    def __init__(self):
-        pg.init()
+    def __init__(self, started=None, threaded=False, telemetry=None,
+                 broadcast=None):
+        # started is the time (from timeit.default_timer) the program started,
+        # if it's given then the time taken to import the game is reported.
+        # If threaded is True, the game is updated on its own thread while
+        # the main thread draws it. If a TelemetryWriter is given as
+        # telemetry, every frame and game event is recorded with it. If a
+        # StreamEncoder is given as broadcast, every frame shown is sent to it.
+        self.startup = PhaseTimer(started)
+        if started is not None:
+            self.startup.mark('imports')
+            # The display is initialised while importing screenconstants
+            self.startup.split('display', DISPLAY_INIT_TIME)
+        # Only initialise the pygame modules which are actually used, rather
+        # than everything with pg.init()
+        pg.display.init()
         pg.display.set_caption('Asteroids')
         pg.mouse.set_visible(False)
         self.surface = pg.display.set_mode((SCREEN_W, SCREEN_H), pg.FULLSCREEN)
-        self.clock = pg.time.Clock()
+        self.startup.mark('window')
+        # HUD loads the font, which is shared with everything else that
+        # draws text
+        self.hud = HUD()
+        self.startup.mark('fonts')
         self.exit = False
-        self.font = pygame.freetype.Font(FONT_PATH)
+        self.threaded = threaded
+        self.telemetry = telemetry
+        self.broadcast = broadcast
+        # Timestamped key events waiting to be applied by the next update
+        self.key_events = deque()
+        self.latency = LatencyMeter()
+        # Number of updates there have been
+        self.steps = 0
         self.highscore = 0
         self.reset()
+        self.startup.mark('game')
 
     def reset(self):
         """Start a new game."""
         self.ship = Ship()
         self.asteroids = []
         self.saucers = []
+        self.particles = Particles()
         self.round = 0
         self.lives = 3
         self.score = 0
-        self.hud = HUD()
         self.saucer_timer = 0
         self.extra_life_counter = 0
         self.start_new_round()
@@ -70,6 +105,7 @@ class Game:
         self.round += 1
         self.asteroids[:] = self.generate_asteroids()
         self.ship.invincible = True
+        self.record(ROUND_START, self.round)
 
     def generate_asteroids(self):
         """Return list of 3 + self.round asteroids."""
@@ -87,6 +123,7 @@ class Game:
             self.saucer_timer %= SECONDS_PER_SAUCER
             size = 1 if uniform(0, 1) < SMALL_SAUCER_RATE else 2
             self.saucers.append(Saucer(size))
+            self.record(SAUCER_SPAWNED, size)
 
     def destroy_asteroid(self, asteroid):
         """
@@ -96,35 +133,15 @@ class Game:
         self.asteroids.remove(asteroid)
         if asteroid.size > 1:
             self.asteroids.extend(asteroid.split())
+        self.particles.emit(asteroid.C, ASTEROID_PARTICLES * asteroid.size,
+                            asteroid.velocity)
+        self.record(ASTEROID_DESTROYED, asteroid.size)
 
     def destroy_saucer(self, saucer):
         """Remove saucer from saucers list"""
         self.saucers.remove(saucer)
-
-    def draw_text(self, text, y, size):
-        """Draw text to surface centred at height y."""
-        text_width = self.font.get_rect(text, size=size).width
-        x = 0.5 * (SCREEN_W - text_width)
-        self.font.render_to(self.surface, (x, y), text, WHITE, size=size)
-
-    def draw_game_over_screen(self):
-        """Draw game after game over."""
-        self.surface.fill(BLACK)
-        # Calculations for spacing of text
-        v = 0.1 * SCREEN_H
-        h1 = self.font.get_rect('0', size=GAMEOVER_SIZE).height
-        h2 = self.font.get_rect('0', size=SCORE_SIZE).height
-        h3 = self.font.get_rect('0', size=PLAY_AGAIN_SIZE).height
-        s2 = 0.5 * h2
-        s1 = 0.5 * (SCREEN_H - 2 * v - h1 - 2 * h2 - h3 - s2)
-        y = v
-        self.draw_text('game over', y, GAMEOVER_SIZE)
-        y += h1 + s1
-        self.draw_text('score {}'.format(self.score), y, SCORE_SIZE)
-        y += h2 + s2
-        self.draw_text('highscore {}'.format(self.highscore), y, SCORE_SIZE)
-        y += h2 + s1
-        self.draw_text('press space to play again', y, PLAY_AGAIN_SIZE)
+        self.particles.emit(saucer.C, SAUCER_PARTICLES,
+                            (saucer.speed * saucer.direction, 0))
 
     def key_down(self, event):
         """Process key down events."""
@@ -151,13 +168,48 @@ class Game:
         elif event.key == pg.K_UP:
             self.ship.boosting = False
 
+    def process_key_event(self, timed_event):
+        """Process timestamped key up or key down event."""
+        event = timed_event.event
+        if event.type == pg.KEYDOWN:
+            self.key_down(event)
+        elif event.type == pg.KEYUP:
+            self.key_up(event)
+        self.latency.applied(self.steps, timed_event)
+
     def event_handler(self):
-        """Process key up and key down events."""
+        """
+        Timestamp key up and key down events and queue them to be applied
+        by the next update.
+        """
+        now = default_timer()
         for event in pg.event.get():
-            if event.type == pg.KEYDOWN:
-                self.key_down(event)
-            elif event.type == pg.KEYUP:
-                self.key_up(event)
+            if event.type in (pg.KEYDOWN, pg.KEYUP):
+                self.key_events.append(TimedEvent(now, event))
+
+    def wait_for_frame(self, deadline):
+        """
+        Keep handling events until deadline, so that they're timestamped
+        within a millisecond or so of arriving rather than once a frame.
+        """
+        self.event_handler()
+        while default_timer() < deadline:
+            pg.time.wait(1)
+            self.event_handler()
+
+    def key_actions(self, dt, now):
+        """
+        Return (offset, action) pairs for the ship to process queued key
+        events at the point in an update of dt seconds, ending at now,
+        that they happened.
+        """
+        actions = []
+        while self.key_events and self.key_events[0].time <= now:
+            timed_event = self.key_events.popleft()
+            offset = min(max(dt - (now - timed_event.time), 0), dt)
+            actions.append((offset, partial(self.process_key_event,
+                                            timed_event)))
+        return actions
 
     def respawn_ship(self):
         """
@@ -166,6 +218,7 @@ class Game:
         """
         self.lives -= 1
         self.ship.spawn()
+        self.record(LIFE_LOST)
 
     def check_collisions(self):
         """Check for collisions between asteroids/saucers/ship."""
@@ -206,13 +259,19 @@ class Game:
                 self.destroy_saucer(saucer)
                 self.score += SAUCER_SCORE[saucer.size]
 
-    def update(self, dt):
-        """Update game by dt seconds."""
-        self.ship.update(dt)
+    def update(self, dt, now=None):
+        """
+        Update game by dt seconds, ending at time now. Key events queued
+        before now are applied part way through the update, at the time
+        they happened.
+        """
+        now = default_timer() if now is None else now
+        self.ship.update(dt, self.key_actions(dt, now))
         for asteroid in self.asteroids:
             asteroid.update(dt)
         for saucer in self.saucers:
             saucer.update(self.ship, dt)
+        self.particles.update(dt)
         self.generate_saucer(dt)
 
         if self.asteroids or self.saucers:
@@ -230,25 +289,129 @@ class Game:
             self.extra_life_counter += 1
             self.lives += 1
 
-    def draw(self):
-        """Draw game while playing."""
-        self.surface.fill(BLACK)
-        self.ship.draw(self.surface)
-        for asteroid in self.asteroids:
-            asteroid.draw(self.surface)
+        self.record(FRAME, dt)
+        if self.telemetry is not None:
+            while self.latency.measured:
+                self.record(INPUT_LATENCY, self.latency.measured.popleft())
+
+    def step(self, dt, now):
+        """
+        Update game by dt seconds ending at time now, or just process key
+        events if the game is over.
+        """
+        self.steps += 1
+        if self.lives > 0:
+            self.update(dt, now)
+        else:
+            while self.key_events:
+                self.process_key_event(self.key_events.popleft())
+
+    def record(self, kind, value=0):
+        """Record telemetry of kind with current state of game."""
+        if self.telemetry is None:
+            return
+        bullets = len(self.ship.fired_bullets)
         for saucer in self.saucers:
-            saucer.draw(self.surface)
-        self.hud.draw(self.surface, self.score, self.lives)
+            bullets += len(saucer.fired_bullets)
+        self.telemetry.write(kind, value, self.lives, self.score,
+                             len(self.asteroids), len(self.saucers), bullets)
+
+    def bullets(self):
+        """Return list of every bullet fired by the ship and saucers."""
+        bullets = list(self.ship.fired_bullets)
+        for saucer in self.saucers:
+            bullets.extend(saucer.fired_bullets)
+        return bullets
+
+    def snapshot(self):
+        """Return frame with copy of everything needed to draw game."""
+        outlines = []
+        for entity in [self.ship] + self.asteroids + self.saucers:
+            outlines.extend((closed, freeze(points))
+                            for closed, points in entity.outlines())
+        centres = freeze(self.bullets()).reshape(-1, 2)
+        particles = freeze(numpy.column_stack([
+            self.particles.positions, self.particles.brightness()]))
+        return Frame(tuple(outlines), centres, particles, self.score,
+                     self.highscore, self.lives, self.steps)
+
+    def draw(self):
+        """Draw game straight from its current state."""
+        if self.lives > 0:
+            self.surface.fill(BLACK)
+            self.particles.draw(self.surface)
+            self.ship.draw(self.surface)
+            for asteroid in self.asteroids:
+                asteroid.draw(self.surface)
+            for saucer in self.saucers:
+                saucer.draw(self.surface)
+            # Every bullet is drawn in one go, as when drawing a frame
+            draw_points(self.surface, self.bullets(), BULLET_RADIUS)
+            self.hud.draw(self.surface, self.score, self.lives)
+        else:
+            draw_game_over_screen(self.surface, self.score, self.highscore)
+
+    def show(self, frame=None):
+        """
+        Draw frame (or the game itself, if frame isn't given) to display,
+        and broadcast frame if broadcasting.
+        """
+        if frame is None:
+            self.draw()
+            step = self.steps
+        else:
+            draw_frame(self.surface, frame, self.hud)
+            step = frame.step
+        pg.display.update()
+        self.latency.displayed(step)
+        if frame is not None and self.broadcast is not None:
+            self.broadcast.send(frame)
 
     def play(self):
         """Play game until exit is True."""
+        if self.threaded:
+            self.play_threaded()
+            return
+        previous = default_timer()
         while not self.exit:
-            self.event_handler()
-            if self.lives > 0:
-                # Time since last frame in seconds
-                dt = self.clock.tick(MAX_FPS) / 1000
-                self.update(dt)
-                self.draw()
-            else:
-                self.draw_game_over_screen()
-            pg.display.update()
+            self.wait_for_frame(previous + 1 / MAX_FPS)
+            now = default_timer()
+            self.step(now - previous, now)
+            previous = now
+            # Frames are only needed to broadcast, otherwise it's cheaper to
+            # draw the game directly
+            self.show(None if self.broadcast is None else self.snapshot())
+
+    def simulate(self, frames):
+        """
+        Update game SIMULATION_FPS times per second until exit is True,
+        publishing a frame to frames after each update.
+        """
+        clock = pg.time.Clock()
+        previous = default_timer()
+        try:
+            while not self.exit:
+                clock.tick(SIMULATION_FPS)
+                now = default_timer()
+                self.step(now - previous, now)
+                previous = now
+                frames.publish(self.snapshot())
+        finally:
+            # Don't leave the main thread drawing a game that has stopped
+            self.exit = True
+
+    def play_threaded(self):
+        """
+        Play game until exit is True, updating game on a separate thread
+        while this thread handles events and draws the latest frame.
+        """
+        frames = FrameBuffer(self.snapshot())
+        simulation = threading.Thread(target=self.simulate, args=(frames,))
+        simulation.daemon = True
+        simulation.start()
+        previous = default_timer()
+        while not self.exit:
+            self.show(frames.latest())
+            self.wait_for_frame(previous + 1 / MAX_FPS)
+            previous = default_timer()
+        simulation.join()
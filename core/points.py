@@ -0,0 +1,79 @@
+import numpy
+import pygame
+import pygame.surfarray
+
+
+WHITE = (255, 255, 255)
+
+# (dx, dy) offsets of the pixels in a disc, keyed by radius
+_discs = {}
+# Mapped colours of each shade of grey, keyed by surface pixel format
+_shades = {}
+
+
+def disc(radius):
+    """Return arrays of x and y offsets of pixels in disc of radius."""
+    if radius not in _discs:
+        r = int(radius)
+        dx, dy = numpy.mgrid[-r:r + 1, -r:r + 1]
+        inside = dx ** 2 + dy ** 2 <= radius ** 2
+        _discs[radius] = (dx[inside], dy[inside])
+    return _discs[radius]
+
+
+def shades(surface):
+    """Return array of surface's mapped colour for each shade of grey."""
+    key = (surface.get_bitsize(), surface.get_masks(), surface.get_shifts())
+    if key not in _shades:
+        _shades[key] = numpy.array(
+            [surface.map_rgb((i, i, i)) for i in range(256)])
+    return _shades[key]
+
+
+def draw_points(surface, centres, radius=0, brightness=None):
+    """
+    Draw white discs of radius centred at each of centres to surface.
+
+    brightness, if given, is the brightness of each disc from 0 (black) to
+    1 (white). Discs only ever brighten pixels, so a dim disc drawn over
+    something brighter (i.e. a fading particle over an outline) doesn't
+    leave a dark hole in it. Every pixel of every disc is written straight
+    into the surface's pixel buffer in one go, so drawing thousands of
+    points costs about the same as drawing one.
+    """
+    centres = numpy.asarray(centres, dtype=float).reshape(-1, 2)
+    if not len(centres):
+        return
+    if brightness is None:
+        levels = numpy.full(len(centres), 255, dtype=numpy.intp)
+    else:
+        levels = numpy.clip(numpy.asarray(brightness) * 255, 0, 255).astype(
+            numpy.intp)
+    # 2d pixel arrays aren't supported for 24 bit surfaces
+    if surface.get_bytesize() == 3:
+        rect = surface.get_rect()
+        for (x, y), level in zip(centres, levels):
+            centre = (int(round(x)), int(round(y)))
+            if radius:
+                pygame.draw.circle(surface, (level,) * 3, centre, radius)
+            # draw.circle draws nothing with a radius of 0
+            elif (rect.collidepoint(centre)
+                  and level > surface.get_at(centre)[0]):
+                surface.set_at(centre, (level,) * 3)
+        return
+
+    dx, dy = disc(radius)
+    centres = numpy.rint(centres).astype(numpy.intp)
+    xs = (centres[:, 0, None] + dx).ravel()
+    ys = (centres[:, 1, None] + dy).ravel()
+    width, height = surface.get_size()
+    on_screen = (0 <= xs) & (xs < width) & (0 <= ys) & (ys < height)
+    pixels = pygame.surfarray.pixels2d(surface)
+    colours = numpy.repeat(shades(surface)[levels], len(dx)).astype(
+        pixels.dtype)
+    # Everything drawn is grey, and brighter greys map to larger values, so
+    # the brightest of the existing pixel and every disc covering it is kept
+    numpy.maximum.at(pixels, (xs[on_screen], ys[on_screen]),
+                     colours[on_screen])
+    # Surface stays locked until pixel array is deleted
+    del pixels
@@ -1,8 +1,22 @@
+from timeit import default_timer
+
 import pygame
 from pylygon import Polygon
 
 
+# Only the display is needed to find the screen size, every other pygame
+# module is initialised when (and if) it's needed. The display itself can't
+# be initialised lazily: the size of almost everything in the game (and some
+# constructor defaults) is a module level constant derived from the screen
+# size, so it has to be known when the components are imported. Importing
+# anything from the core package imports the game, and so this, which is why
+# the telemetry module that monitor.py uses lives outside of it.
+_started = default_timer()
 pygame.display.init()
-SCREEN_W = w = pygame.display.Info().current_w
-SCREEN_H = h = pygame.display.Info().current_h
+# Time taken to initialise the display, so that startup can report it apart
+# from the rest of the imports it happens during
+DISPLAY_INIT_TIME = default_timer() - _started
+_info = pygame.display.Info()
+SCREEN_W = w = _info.current_w
+SCREEN_H = h = _info.current_h
 SCREEN_RECT = Polygon([(0, 0), (w, 0), (w, h), (0, h)])
@@ -0,0 +1,108 @@
+from __future__ import division, print_function
+
+import argparse
+import os
+import sys
+
+try:
+    import tracemalloc
+except ImportError:
+    sys.exit('membench.py needs tracemalloc, which is only in Python 3.4+')
+
+# Nothing is drawn, so the benchmark can run without a display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from core.components import Asteroid, Saucer, Ship  # noqa: E402
+from core.components.ships import Bullet  # noqa: E402
+from pygame.math import Vector2  # noqa: E402
+
+
+def parse_args():
+    """Return parsed command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Report memory used by game entities.')
+    parser.add_argument('--entities', type=int, default=1000,
+                        help='number of each entity to measure size over')
+    parser.add_argument('--frames', type=int, default=600,
+                        help='number of frames to simulate')
+    parser.add_argument('--asteroids', type=int, default=40,
+                        help='number of asteroids in simulated late game')
+    parser.add_argument('--saucers', type=int, default=4,
+                        help='number of saucers in simulated late game')
+    return parser.parse_args()
+
+
+def bytes_per_entity(make, count):
+    """Return average bytes allocated for each of count calls of make."""
+    tracemalloc.start()
+    entities = [make() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return size / count
+
+
+def simulate(args):
+    """
+    Simulate late game and return average (peak, retained, allocations)
+    per frame, where peak is the most bytes allocated during the frame at
+    once, retained is how many of them were still allocated at the end and
+    allocations is the number of memory blocks those were allocated in.
+    """
+    dt = 1 / 60
+    ship = Ship()
+    ship.boosting = True
+    ship.rotate_direction = 1
+    asteroids = [Asteroid() for _ in range(args.asteroids)]
+    saucers = [Saucer(1 + i % 2) for i in range(args.saucers)]
+    # tracemalloc's own allocations (i.e. while taking a snapshot) aren't
+    # counted
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    peak = retained = allocations = 0
+    for frame in range(args.frames):
+        tracemalloc.start()
+        if frame % 10 == 0:
+            ship.shoot()
+        ship.update(dt)
+        for asteroid in asteroids:
+            asteroid.update(dt)
+        for saucer in saucers:
+            saucer.update(ship, dt)
+        current, frame_peak = tracemalloc.get_traced_memory()
+        # Tracing started with the frame, so every block traced was
+        # allocated during it
+        snapshot = tracemalloc.take_snapshot().filter_traces(ignore)
+        tracemalloc.stop()
+        peak += frame_peak
+        retained += current
+        allocations += sum(stat.count
+                           for stat in snapshot.statistics('lineno'))
+    frames = args.frames
+    return peak / frames, retained / frames, allocations / frames
+
+
+def main():
+    """Print memory used by each entity and by each simulated frame."""
+    args = parse_args()
+    entities = [
+        ('ship', Ship),
+        ('saucer', lambda: Saucer(2)),
+        ('asteroid', Asteroid),
+        ('bullet', lambda: Bullet((0, 0), Vector2(1, 0))),
+    ]
+    print('{:<12}{:>12}'.format('entity', 'bytes'))
+    for name, make in entities:
+        print('{:<12}{:>12.0f}'.format(
+            name, bytes_per_entity(make, args.entities)))
+    peak, retained, allocations = simulate(args)
+    print()
+    print('{} asteroids, {} saucers over {} frames'.format(
+        args.asteroids, args.saucers, args.frames))
+    print('{:<12}{:>12}{:>14}'.format('per frame', 'bytes', 'allocations'))
+    print('{:<12}{:>12.0f}{:>14}'.format('peak', peak, ''))
+    print('{:<12}{:>12.0f}{:>14.1f}'.format('retained', retained,
+                                            allocations))
+
+
+if __name__ == '__main__':
+    main()
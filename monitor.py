@@ -0,0 +1,117 @@
+from __future__ import division, print_function
+
+import argparse
+from collections import Counter, deque
+import csv
+import sys
+import time
+
+from telemetry import (FRAME, INPUT_LATENCY, Record, TelemetryReader,
+                       kind_name)
+
+
+# Number of most recent frames/key events that frame time and input latency
+# statistics are taken over
+WINDOW = 120
+
+
+def parse_args():
+    """Return parsed command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Watch telemetry published by a running game.')
+    parser.add_argument('path', help='telemetry file given to asteroids.py')
+    parser.add_argument('--csv', metavar='FILE',
+                        help='also export every record read to FILE')
+    parser.add_argument('--once', action='store_true',
+                        help='read what is in the buffer and exit, rather '
+                             'than tailing it')
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help='seconds between reads when tailing')
+    return parser.parse_args()
+
+
+def open_csv(path):
+    """
+    Return file at path opened for csv.writer, which writes its own line
+    endings, so the file mustn't translate them (i.e. into \r\r\n on
+    Windows).
+    """
+    if sys.version_info[0] < 3:
+        return open(path, 'wb')
+    return open(path, 'w', newline='')
+
+
+class Statistics:
+    """Live statistics about the records read so far."""
+
+    def __init__(self):
+        self.frame_times = deque(maxlen=WINDOW)
+        self.input_latencies = deque(maxlen=WINDOW)
+        self.events = Counter()
+        self.latest = None
+
+    def add(self, record):
+        """Update statistics with record."""
+        if record.kind == FRAME:
+            self.frame_times.append(record.value)
+        else:
+            self.events[record.kind] += 1
+        if record.kind == INPUT_LATENCY:
+            self.input_latencies.append(record.value)
+        self.latest = record
+
+    def summary(self):
+        """Return one line summary of statistics."""
+        if self.latest is None:
+            return 'waiting for telemetry...'
+        parts = []
+        if self.frame_times:
+            mean = sum(self.frame_times) / len(self.frame_times)
+            parts.append('{:5.1f} fps, frame {:5.1f} ms (max {:5.1f})'.format(
+                1 / mean if mean else 0, 1000 * mean,
+                1000 * max(self.frame_times)))
+        if self.input_latencies:
+            parts.append('input latency {:5.1f} ms (max {:5.1f})'.format(
+                1000 * sum(self.input_latencies) / len(self.input_latencies),
+                1000 * max(self.input_latencies)))
+        latest = self.latest
+        parts.append('{} asteroids, {} saucers, {} bullets'.format(
+            latest.asteroids, latest.saucers, latest.bullets))
+        parts.append('score {}, lives {}'.format(latest.score, latest.lives))
+        parts.extend('{} {}'.format(count, kind_name(kind))
+                     for kind, count in sorted(self.events.items()))
+        return ' | '.join(parts)
+
+
+def main():
+    """Tail telemetry file, printing live statistics."""
+    args = parse_args()
+    reader = TelemetryReader(args.path)
+    statistics = Statistics()
+    csv_file = writer = None
+    if args.csv:
+        csv_file = open_csv(args.csv)
+        writer = csv.writer(csv_file)
+        writer.writerow(Record._fields + ('event',))
+    try:
+        while True:
+            for record in reader.read():
+                statistics.add(record)
+                if writer is not None:
+                    writer.writerow(record + (kind_name(record.kind),))
+            if args.once:
+                print(statistics.summary())
+                break
+            sys.stdout.write('\r' + statistics.summary())
+            sys.stdout.flush()
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print()
+    finally:
+        reader.close()
+        if csv_file is not None:
+            csv_file.close()
+
+
+if __name__ == '__main__':
+    main()
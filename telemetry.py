@@ -0,0 +1,153 @@
+"""
+Telemetry published by a running game into a memory mapped ring buffer
+file, so that it can be monitored by another process.
+
+The file starts with a header followed by capacity fixed size records:
+
+    header: magic, version, record size, capacity, records written
+    record: seq, time, kind, lives, asteroids, saucers, bullets, value, score
+
+seq is the number of records written before that record, so record seq is
+stored in slot seq % capacity. value depends on kind: the frame time for
+FRAME, the size of the asteroid/saucer for ASTEROID_DESTROYED and
+SAUCER_SPAWNED, the round number for ROUND_START and the time from a key
+event being received to it being displayed for INPUT_LATENCY.
+
+Version 2 added INPUT_LATENCY records, but is otherwise laid out the same
+as version 1, so version 1 files can still be read. Readers should expect
+kinds they don't know about, which kind_name gives a generic name to.
+
+There's only ever one writer. It fills in a record and only then bumps
+records written in the header, so it never has to wait for readers.
+Readers check records written again after copying records out, and drop
+any which the writer could have started overwriting in the meantime.
+
+This module only uses the standard library so that it can be imported
+without pygame, and lives outside the core package so that importing it
+(i.e. from monitor.py) doesn't import the game and initialise the display.
+"""
+from collections import namedtuple
+import mmap
+import struct
+from timeit import default_timer
+
+
+MAGIC = b'ASTT'
+VERSION = 2
+# Versions with the same header and record layout, which can all be read
+READABLE_VERSIONS = (1, 2)
+
+HEADER = struct.Struct('<4sHHIQ12x')
+RECORD = struct.Struct('<QdBBHHHfI')
+# Offset of records written in header
+WRITTEN = struct.Struct('<Q')
+WRITTEN_OFFSET = 12
+
+DEFAULT_CAPACITY = 4096
+
+# Record kinds
+FRAME = 0
+ASTEROID_DESTROYED = 1
+SAUCER_SPAWNED = 2
+LIFE_LOST = 3
+ROUND_START = 4
+INPUT_LATENCY = 5
+KIND_NAMES = {
+    FRAME: 'frame',
+    ASTEROID_DESTROYED: 'asteroid destroyed',
+    SAUCER_SPAWNED: 'saucer spawned',
+    LIFE_LOST: 'life lost',
+    ROUND_START: 'round start',
+    INPUT_LATENCY: 'input',
+}
+
+
+def kind_name(kind):
+    """Return name of record kind, even if it's from a newer version."""
+    return KIND_NAMES.get(kind, 'kind {}'.format(kind))
+
+
+Record = namedtuple('Record', ['seq', 'time', 'kind', 'lives', 'asteroids',
+                               'saucers', 'bullets', 'value', 'score'])
+
+
+class TelemetryWriter:
+    """Writes telemetry records to ring buffer file at path."""
+
+    def __init__(self, path, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.written = 0
+        self.start = default_timer()
+        size = HEADER.size + capacity * RECORD.size
+        self.file = open(path, 'w+b')
+        self.file.truncate(size)
+        self.buffer = mmap.mmap(self.file.fileno(), size)
+        HEADER.pack_into(self.buffer, 0, MAGIC, VERSION, RECORD.size,
+                         capacity, 0)
+
+    def write(self, kind, value, lives, score, asteroids, saucers, bullets):
+        """
+        Write record to next slot in buffer.
+
+        Records are packed straight into the mapped file, so writing one
+        doesn't create any intermediate bytes objects.
+        """
+        offset = HEADER.size + self.written % self.capacity * RECORD.size
+        RECORD.pack_into(self.buffer, offset, self.written,
+                         default_timer() - self.start, kind, lives, asteroids,
+                         saucers, bullets, value, score)
+        self.written += 1
+        WRITTEN.pack_into(self.buffer, WRITTEN_OFFSET, self.written)
+
+    def close(self):
+        """Close buffer and file."""
+        self.buffer.close()
+        self.file.close()
+
+
+class TelemetryReader:
+    """Reads telemetry records from ring buffer file at path."""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, self.capacity, _ = HEADER.unpack_from(
+            self.buffer)
+        if magic != MAGIC:
+            raise ValueError('{} is not a telemetry file'.format(path))
+        if version not in READABLE_VERSIONS or record_size != RECORD.size:
+            raise ValueError(
+                '{} has telemetry version {}, expected up to {}'.format(
+                    path, version, VERSION))
+        # seq of next record to be read
+        self.next = 0
+
+    def written(self):
+        """Return number of records written so far."""
+        return WRITTEN.unpack_from(self.buffer, WRITTEN_OFFSET)[0]
+
+    def read(self):
+        """
+        Return records written since last read, oldest first.
+
+        Records which were overwritten before they could be read are
+        skipped.
+        """
+        written = self.written()
+        first = max(self.next, written - self.capacity)
+        records = []
+        for seq in range(first, written):
+            offset = HEADER.size + seq % self.capacity * RECORD.size
+            record = Record._make(RECORD.unpack_from(self.buffer, offset))
+            if record.seq == seq:
+                records.append(record)
+        # Writer may have been overwriting the oldest records while they were
+        # copied, so only keep those which are still safely in the buffer
+        oldest = self.written() - self.capacity + 1
+        self.next = written
+        return [record for record in records if record.seq >= oldest]
+
+    def close(self):
+        """Close buffer and file."""
+        self.buffer.close()
+        self.file.close()
@@ -0,0 +1,147 @@
+from __future__ import division
+
+import os
+import socket
+import threading
+import unittest
+
+# Importing the core package initialises the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy  # noqa: E402
+
+from core.broadcast import (  # noqa: E402
+    DELTA, KEY, KEYFRAME_INTERVAL, MESSAGE_HEADER, QUEUE_SIZE, SCALE,
+    StreamDecoder, StreamEncoder)
+from core.frames import Frame  # noqa: E402
+
+
+WIDTH = 800
+HEIGHT = 600
+
+
+def make_frame(number, shapes=3, bullets=2, particles=5, offset=0):
+    """
+    Return frame number of a game where shapes outlines and bullets drift
+    across the screen, with score set to number to identify it.
+    """
+    random = numpy.random.RandomState(number)
+    outlines = tuple(
+        (i % 2 == 0, numpy.array([[10 * i + j + 1.3 * number + offset,
+                                   20 * j + 0.7 * number] for j in range(4)]))
+        for i in range(shapes))
+    return Frame(outlines,
+                 random.uniform(0, HEIGHT, (bullets, 2)),
+                 numpy.column_stack([random.uniform(0, HEIGHT, (particles, 2)),
+                                     random.uniform(0, 1, particles)]),
+                 number, 1000, 3, number)
+
+
+class BroadcastTest(unittest.TestCase):
+
+    def setUp(self):
+        sender, receiver = socket.socketpair()
+        self.sockets = [sender, receiver]
+        self.encoder = StreamEncoder(sender.makefile('wb'), WIDTH, HEIGHT)
+        self.stream = receiver.makefile('rb')
+
+    def tearDown(self):
+        self.encoder.close()
+        self.stream.close()
+        for connection in self.sockets:
+            connection.close()
+
+    def decode_all(self):
+        """Close encoder and return every (time, frame) decoded."""
+        frames = []
+        reader = threading.Thread(target=lambda: frames.extend(
+            StreamDecoder(self.stream).frames()))
+        reader.start()
+        self.encoder.close()
+        self.sockets[0].shutdown(socket.SHUT_WR)
+        reader.join()
+        return frames
+
+    def assert_same(self, decoded, sent):
+        """Assert decoded frame matches sent frame to within a step."""
+        self.assertEqual(len(decoded.outlines), len(sent.outlines))
+        for (closed, points), (sent_closed, sent_points) in zip(
+                decoded.outlines, sent.outlines):
+            self.assertEqual(closed, sent_closed)
+            self.assertLessEqual(abs(points - sent_points).max(), 1 / SCALE)
+        self.assertLessEqual(abs(decoded.bullets - sent.bullets).max(),
+                             1 / SCALE)
+        self.assertLessEqual(
+            abs(decoded.particles[:, :2] - sent.particles[:, :2]).max(),
+            1 / SCALE)
+        self.assertLessEqual(
+            abs(decoded.particles[:, 2] - sent.particles[:, 2]).max(),
+            1 / 255)
+        self.assertEqual((decoded.score, decoded.highscore, decoded.lives),
+                         (sent.score, sent.highscore, sent.lives))
+
+    def test_round_trip(self):
+        # Outlines and bullets change part way through, so frames are sent
+        # as both key and delta frames
+        sent = [make_frame(i, shapes=3 if i < 20 else 4) for i in range(40)]
+        for frame in sent:
+            self.encoder.send(frame)
+        decoded = self.decode_all()
+        self.assertEqual(len(decoded) + self.encoder.dropped, len(sent))
+        for _, frame in decoded:
+            self.assert_same(frame, sent[frame.score])
+
+    def test_times_increase(self):
+        for i in range(5):
+            self.encoder.send(make_frame(i))
+        times = [time for time, _ in self.decode_all()]
+        self.assertEqual(times, sorted(times))
+
+    def test_same_frame_sent_once(self):
+        frame = make_frame(0)
+        self.encoder.send(frame)
+        self.encoder.send(frame)
+        self.assertEqual(len(self.decode_all()), 1)
+
+    def test_key_and_delta_frames(self):
+        kinds = [MESSAGE_HEADER.unpack_from(
+                     self.encoder.encode(0, make_frame(i)))[1]
+                 for i in range(KEYFRAME_INTERVAL + 2)]
+        # Only the first frame and the one after KEYFRAME_INTERVAL deltas
+        # have to be key frames
+        self.assertEqual(kinds[0], KEY)
+        self.assertEqual(kinds[1:KEYFRAME_INTERVAL + 1],
+                         [DELTA] * KEYFRAME_INTERVAL)
+        self.assertEqual(kinds[KEYFRAME_INTERVAL + 1], KEY)
+        new_structure = self.encoder.encode(0, make_frame(0, bullets=3))
+        self.assertEqual(MESSAGE_HEADER.unpack_from(new_structure)[1], KEY)
+
+    def test_deltas_wrap(self):
+        # Jumping from one end of the int16 range to the other overflows
+        # the delta, which has to wrap back when decoded
+        limit = 32000 / SCALE
+        sent = [make_frame(0, offset=-limit), make_frame(1, offset=limit),
+                make_frame(2, offset=-limit)]
+        for frame in sent:
+            self.encoder.send(frame)
+        decoded = self.decode_all()
+        self.assertEqual(len(decoded), len(sent))
+        for _, frame in decoded:
+            self.assert_same(frame, sent[frame.score])
+
+    def test_frames_dropped_when_viewer_stalls(self):
+        # Frames are big enough to fill the socket buffers long before
+        # they've all been sent, and nothing is read until then
+        sent = [make_frame(i, shapes=500, particles=2000) for i in range(200)]
+        for frame in sent:
+            self.encoder.send(frame)
+        self.assertGreater(self.encoder.dropped, 0)
+        decoded = self.decode_all()
+        self.assertEqual(len(decoded) + self.encoder.dropped, len(sent))
+        self.assertGreaterEqual(len(decoded), QUEUE_SIZE)
+        for _, frame in decoded:
+            self.assert_same(frame, sent[frame.score])
+
+
+if __name__ == '__main__':
+    unittest.main()
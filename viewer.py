@@ -0,0 +1,65 @@
+import argparse
+import time
+
+import pygame as pg
+
+from core.broadcast import StreamDecoder, listen
+from core.components import HUD
+from core.frames import draw_frame
+
+
+def parse_args():
+    """Return parsed command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Watch a game broadcast with asteroids.py --broadcast.')
+    parser.add_argument('source', help='recorded broadcast file, or HOST:PORT '
+                                       'to listen on with --listen')
+    parser.add_argument('--listen', action='store_true',
+                        help='wait for a game to broadcast to HOST:PORT')
+    parser.add_argument('--scale', type=float, default=1,
+                        help='scale window by this factor')
+    return parser.parse_args()
+
+
+def quit_requested():
+    """Return True if window has been closed or escape pressed."""
+    for event in pg.event.get():
+        if event.type == pg.QUIT:
+            return True
+        if event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE:
+            return True
+    return False
+
+
+def main():
+    """Show broadcast frames in a window at the pace they were sent."""
+    args = parse_args()
+    stream = listen(args.source) if args.listen else open(args.source, 'rb')
+    decoder = StreamDecoder(stream)
+    size = (decoder.width, decoder.height)
+    window_size = tuple(int(args.scale * x) for x in size)
+    pg.display.set_caption('Asteroids (spectating)')
+    window = pg.display.set_mode(window_size)
+    canvas = window if window_size == size else pg.Surface(size)
+    # Everything is sized to the game's screen, not this one
+    hud = HUD(decoder.height)
+    started = None
+    for sent, frame in decoder.frames():
+        if quit_requested():
+            break
+        # Keep to the pace frames were sent at, which only matters when
+        # playing back a recording
+        if started is None:
+            started = time.time() - sent
+        delay = started + sent - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        draw_frame(canvas, frame, hud)
+        if canvas is not window:
+            pg.transform.smoothscale(canvas, window_size, window)
+        pg.display.update()
+    stream.close()
+
+
+if __name__ == '__main__':
+    main()